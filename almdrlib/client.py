@@ -8,22 +8,98 @@
 
 import abc
 import functools
+import hashlib
 import inspect
 import logging
 import json
+import os
+import pickle
+import re
+import stat
+import string
+import sys
+from collections.abc import Mapping
+from urllib.parse import unquote
+import yaml
 import jsonschema
 from jsonschema.validators import validator_for
 import alsdkdefs
 
+import almdrlib.constants
 from almdrlib.exceptions import AlmdrlibValueError
 from almdrlib.config import Config
 
 from alsdkdefs import OpenAPIKeyWord
 
+try:
+    # libyaml based loader is an order of magnitude faster
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_SPEC_FILE_NAME_RE = re.compile(r'^(?P<service>.+)\.v(?P<version>\d+)\.yaml$')
+_SPEC_CACHE_SUFFIX = '.pkl'
+# Bump when the loaded definitions change shape
+_SPEC_CACHE_VERSION = 1
+_REQUIRED_SPEC_KEYS = (
+    OpenAPIKeyWord.OPENAPI,
+    OpenAPIKeyWord.INFO,
+    OpenAPIKeyWord.PATHS
+)
+
+# Request body content types validated and encoded as JSON
+_JSON_CONTENT_TYPES = frozenset([
+    'application/json', 'alertlogic/json', 'alertlogic.com/json'
+])
+
+_SIMPLE_DATA_TYPES = frozenset(OpenAPIKeyWord.SIMPLE_DATA_TYPES)
+
+# Keywords used on every request, bound once as module globals
+_CONTENT_TYPE_PARAM = OpenAPIKeyWord.CONTENT_TYPE_PARAM
+_CONTENT_TYPE_PYTHON_PARAM = OpenAPIKeyWord.CONTENT_TYPE_PYTHON_PARAM
+
+_QUERY_PARAMETER_STYLES = frozenset([
+    OpenAPIKeyWord.PARAMETER_STYLE_FORM,
+    OpenAPIKeyWord.PARAMETER_STYLE_SPACE_DELIMITED,
+    OpenAPIKeyWord.PARAMETER_STYLE_PIPE_DELIMITED
+])
+
+_boolean_strings = {True: "true", False: "false"}
+
+_value_serializers = {
+    OpenAPIKeyWord.STRING: lambda value: value,
+    OpenAPIKeyWord.BOOLEAN: lambda value: _boolean_strings[bool(value)]
+}
+
+# Parameter locations in the order operation arguments are serialized
+_PARAMETER_LOCATIONS = (
+    OpenAPIKeyWord.PATH,
+    OpenAPIKeyWord.QUERY,
+    OpenAPIKeyWord.HEADER,
+    OpenAPIKeyWord.COOKIE
+)
+
+# Marks arguments that were not provided, None is a valid value
+_MISSING = object()
+
+# Compiled jsonschema validators keyed by the schema's canonical JSON
+_validators = {}
+# Same validators keyed by id() of loaded definitions' schema objects,
+# together with the schema itself, which keeps the id from being reused
+_validators_by_id = {}
+
 
 class Server(object):
+    __slots__ = ('_service_name', '_spec', '_session', '_url', '_description',
+                 '_variables', '_resolved_url')
+
     def __init__(self, service_name, spec,
                  session=None, variables=None):
         self._service_name = service_name
@@ -32,31 +108,39 @@ class Server(object):
         self._url = spec.get(OpenAPIKeyWord.URL)
         self._description = spec.get(OpenAPIKeyWord.DESCRIPTION)
 
-        if variables:
+        variables_spec = spec.get(OpenAPIKeyWord.VARIABLES)
+        if variables is not None:
             self.variables = variables
-        elif OpenAPIKeyWord.VARIABLES in spec:
-            self.variables = dict(
-                    (k, v.get(OpenAPIKeyWord.DEFAULT))
-                    for k, v in spec[OpenAPIKeyWord.VARIABLES].items())
+        elif variables_spec:
+            self.variables = {
+                    k: v.get(OpenAPIKeyWord.DEFAULT)
+                    for k, v in variables_spec.items()
+                }
         else:
-            self.variables = variables
+            self.variables = None
 
         if spec.get(OpenAPIKeyWord.X_ALERTLOGIC_SESSION_ENDPOINT) and \
                 self._session:
             self.update_url()
 
-        logger.debug(f"Server initialized using '{self._url}' URL " +
-                     f"for '{self._service_name}' service.")
+        logger.debug("Server initialized using '%s' URL for '%s' service.",
+                     self._url, self._service_name)
 
     def update_url(self, account_id=None):
-        self._url = self._session.get_url(self._service_name, account_id)
+        self.set_url(self._session.get_url(self._service_name, account_id))
 
     @property
     def url(self):
-        if self.variables:
-            return self._url.format(**self.variables)
-        else:
-            return self._url
+        return self._resolved_url
+
+    @property
+    def variables(self):
+        return self._variables
+
+    @variables.setter
+    def variables(self, variables):
+        self._variables = variables
+        self._resolve_url()
 
     @property
     def spec(self):
@@ -64,15 +148,25 @@ class Server(object):
 
     def set_url(self, url):
         self._url = url
+        self._resolve_url()
+
+    def _resolve_url(self):
+        # Server variables rarely change, substitute them once
+        # instead of on every url access
+        if self._variables:
+            self._resolved_url = self._url.format(**self._variables)
+        else:
+            self._resolved_url = self._url
 
 
 class OperationResponse(object):
-    _response_schema = {}
+    __slots__ = ('_response_schema', '_schema')
 
     def __init__(self, schema, session=None):
+        self._response_schema = {}
         for r_code, r_schema in schema.items():
             if r_code[0] == '2':
-                self._add_response(r_schema.pop(OpenAPIKeyWord.CONTENT, None))
+                self._add_response(r_schema.get(OpenAPIKeyWord.CONTENT))
 
         self._schema = schema
 
@@ -85,9 +179,9 @@ class OperationResponse(object):
         content_type, content_type_schema = next(iter(content.items()))
         if content_type not in OpenAPIKeyWord.JSON_CONTENT_TYPES:
             logger.warn(
-                    f"{content_type} content type is unsupported." +
-                    f"Only {OpenAPIKeyWord.JSON_CONTENT_TYPES} " +
-                    "content types are supported"
+                    "%s content type is unsupported."
+                    "Only %s content types are supported",
+                    content_type, OpenAPIKeyWord.JSON_CONTENT_TYPES
             )
         if not content_type_schema:
             return
@@ -104,16 +198,20 @@ class OperationResponse(object):
 
 
 class RequestBodyParameter(object):
-    def __init__(self, name, content_type, schema, required=False, session=None):
+    __slots__ = ('_name', '_content_type', '_schema', '_required', '_session',
+                 '_validator')
+
+    def __init__(self, name, content_type, schema, required=False, session=None,
+                 shared_schema=True):
         self._name = name
         self._content_type = content_type
         self._schema = schema
         self._required = required
         self._session = session
 
-        validator_cls = validator_for(schema)
-        validator_cls.check_schema(schema)
-        self._validator = validator_cls(schema)
+        # shared_schema is False for schemas built for this parameter
+        # only, rather than taken from the loaded definitions
+        self._validator = _get_validator(schema, shared_schema)
 
     @abc.abstractmethod
     def serialize(self, value, header=[]):
@@ -124,8 +222,13 @@ class RequestBodyParameter(object):
         try:
             self._validator.validate(data)
         except jsonschema.exceptions.ValidationError as e:
-            logger.debug(f"Validation error: {e.message}.\nSchema:\n{json.dumps(e.schema, indent=2)}")
-            raise AlmdrlibValueError(f"Validation Error: {e.message}") from None
+            # The failing schema is kept on the error, only format it
+            # when it is going to be logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Validation error: %s.\nSchema:\n%s",
+                             e.message, _json_format(e.schema))
+            raise AlmdrlibValueError(f"Validation Error: {e.message}",
+                                     schema=e.schema) from None
 
     @property
     def name(self):
@@ -147,20 +250,23 @@ class RequestBodyParameter(object):
 
 
 class RequestBodySchemaParameter(RequestBodyParameter):
+    __slots__ = ()
+
     def __init__(self, name, content_type, schema, required=False, session=None):
         super().__init__(name, content_type, schema, required, session)
 
     def serialize(self, kwargs, header=[]):
         data = kwargs.pop(self.name, {})
-        json_content_types = ['application/json', 'alertlogic/json', 'alertlogic.com/json']
-        if self.content_type in json_content_types:    
+        if self.content_type in _JSON_CONTENT_TYPES:
             self.validate(data)
-            kwargs['data'] = json.dumps(data)
+            kwargs['data'] = _json_dumps(data)
         else:
             kwargs['data'] = data
 
 
 class RequestBodySimpleParameter(RequestBodyParameter):
+    __slots__ = ('_format',)
+
     def __init__(self, name, content_type, schema, required=False, session=None):
         super().__init__(name, content_type, schema, required, session)
         self._format = schema.get(OpenAPIKeyWord.FORMAT)
@@ -174,6 +280,10 @@ class RequestBodySimpleParameter(RequestBodyParameter):
 
 
 class RequestBodyObjectParameter(RequestBodyParameter):
+    __slots__ = ('_encoding', '_explode', '_properties', '_required_properties',
+                 '_property_names', '_property_name_set',
+                 '_required_property_names')
+
     def __init__(self,
                  name,
                  content_type,
@@ -181,17 +291,17 @@ class RequestBodyObjectParameter(RequestBodyParameter):
                  al_schema={},
                  required=False,
                  session=None):
+        normalized_schema = _normalize_schema(name, schema, required)
         super().__init__(
                 name,
                 content_type,
-                _normalize_schema(name,
-                                  schema,
-                                  required),
+                normalized_schema,
                 required,
-                session
+                session,
+                shared_schema=normalized_schema is schema
             )
 
-        self._encoding = al_schema.pop(OpenAPIKeyWord.ENCODING, None)
+        self._encoding = al_schema.get(OpenAPIKeyWord.ENCODING)
         self._explode = \
             self._encoding and \
             self._encoding.get(OpenAPIKeyWord.EXPLODE, False)
@@ -203,44 +313,52 @@ class RequestBodyObjectParameter(RequestBodyParameter):
         self._required_properties = self._schema.get(
                                             OpenAPIKeyWord.REQUIRED, [])
 
+        self._property_names = tuple(self._properties or ())
+        self._property_name_set = frozenset(self._property_names)
+        self._required_property_names = frozenset(self._required_properties)
+
         if self._properties:
-            for name in self._required_properties:
-                self._properties[name].update(
-                        {'x-alertlogic-required': True})
+            # Flag required properties on copies, the spec is shared
+            self._properties = {
+                name: (dict(schema, **{'x-alertlogic-required': True})
+                       if name in self._required_properties else schema)
+                for name, schema in self._properties.items()
+            }
 
         logger.debug(
-                "Initialized body parameter. "
-                f"Name: {self.name}. "
-                "Properties: "
-                f"{self._properties and self._properties.keys() or self.name}"
-                "Required Properties: "
-                f"{self._required_properties}"
+                "Initialized body parameter. Name: %s. "
+                "Properties: %s Required Properties: %s",
+                self.name, self._property_names or self.name,
+                self._required_properties
             )
 
     def serialize(self, kwargs, headers=None):
-        if not all(name in kwargs for name in self._required_properties):
+        # Only a few of the properties are usually passed, look at the
+        # arguments rather than at every property. Arguments order is
+        # kept, so the payload is serialized the same way every time.
+        names = self._property_name_set
+        result = {name: kwargs.pop(name)
+                  for name in [name for name in kwargs if name in names]}
+
+        missing = self._required_property_names.difference(result)
+        if missing:
             raise AlmdrlibValueError(
-                f"'{self._required_properties}' parameters are required. " +
-                f"'{kwargs}' were provided.")
-
-        result = {
-                    k: kwargs.pop(k)
-                    for k in self._properties.keys() if k in kwargs
-                }
+                f"'{sorted(missing)}' parameters are required. " +
+                f"'{list(result)}' were provided.")
 
-        if self.required and not bool(result):
+        if self.required and not result:
             raise AlmdrlibValueError(
                 "At least one the " +
-                f"{self._properties.keys()} parameters must be specified."
+                f"{list(self._property_names)} parameters must be specified."
             )
 
         # Validate provided payload against the schema
         self.validate(result)
 
         if self._explode:
-            kwargs['data'] = json.dumps(result.pop(self.name))
+            kwargs['data'] = _json_dumps(result.pop(self.name))
         else:
-            kwargs['data'] = json.dumps(result)
+            kwargs['data'] = _json_dumps(result)
 
     @property
     def schema(self):
@@ -248,14 +366,18 @@ class RequestBodyObjectParameter(RequestBodyParameter):
 
 
 class RequestBody(object):
+    __slots__ = ('_parameters', '_required', '_description', '_session',
+                 '_content', '_default_content_type',
+                 '_schema')
+
     def __init__(self, required=False, description=None, session=None):
         self._parameters = {}
         self._required = required
         self._description = description
         self._session = session
-        self._content_types = {}
         self._content = {}
         self._default_content_type = False
+        self._schema = None
 
     @property
     def default_content_type(self):
@@ -285,7 +407,7 @@ class RequestBody(object):
                             required=self._required,
                             session=self._session
                         )
-        elif datatype in OpenAPIKeyWord.SIMPLE_DATA_TYPES:
+        elif datatype in _SIMPLE_DATA_TYPES:
             parameter = RequestBodySimpleParameter(
                             name=name,
                             content_type = content_type,
@@ -303,6 +425,9 @@ class RequestBody(object):
                         )
 
         self._content[content_type] = parameter
+        # Content derived values are computed lazily, reset them
+        self._default_content_type = False
+        self._schema = None
 
         if name in self._parameters:
             self._parameters[name].update({content_type: parameter.schema})
@@ -311,40 +436,42 @@ class RequestBody(object):
 
     def serialize(self, headers, kwargs):
         #
-        # Get content parameters.
+        # Get content parameters: content_type argument, content-type
+        # header parameter or the only content type of the body
         #
-        if 'content_type' in kwargs:
-            content_type = kwargs.pop('content_type')
-            payload_body_param = self._content[content_type]
-            headers[OpenAPIKeyWord.CONTENT_TYPE_PARAM] = content_type
-        elif OpenAPIKeyWord.CONTENT_TYPE_PARAM in headers:
-            content_type = headers[OpenAPIKeyWord.CONTENT_TYPE_PARAM]
-            payload_body_param = self._content[content_type]
-        elif self.default_content_type:
-            ct = self.default_content_type
-            payload_body_param = self._content[ct]
-            headers[OpenAPIKeyWord.CONTENT_TYPE_PARAM] = ct
-        else:
+        content_type = \
+            kwargs.pop(_CONTENT_TYPE_PYTHON_PARAM, None) or \
+            headers.get(_CONTENT_TYPE_PARAM) or \
+            self.default_content_type
+        if not content_type:
             raise AlmdrlibValueError(
-                f"'{OpenAPIKeyWord.CONTENT_TYPE_PYTHON_PARAM}'" +
+                f"'{_CONTENT_TYPE_PYTHON_PARAM}'" +
                 "parameter is required.")
 
-        payload_body_param.serialize(kwargs, headers)
+        headers[_CONTENT_TYPE_PARAM] = content_type
+        self._content[content_type].serialize(kwargs, headers)
 
     def get_schema(self):
+        if self._schema is None:
+            self._schema = self._make_schema()
+        # Callers get their own copy of the cached schema
+        return dict(self._schema) if self._schema is not None else None
+
+    def _make_schema(self):
         if self.default_content_type:
             payloadBodyParam = self._content[self.default_content_type]
             return {OpenAPIKeyWord.PROPERTIES: payloadBodyParam.schema}
 
         # Request body supports has multiple content types
-        properties = dict()
-        for name, schema in self._parameters.items():
-            properties[name] = {
-                    'content': {
-                        content_type: parameter.get(name)
-                        for content_type, parameter in schema.items()
-                    }
+        properties = {
+            name: {
+                'content': {
+                    content_type: parameter.get(name)
+                    for content_type, parameter in schema.items()
                 }
+            }
+            for name, schema in self._parameters.items()
+        }
 
         return {
                 OpenAPIKeyWord.PROPERTIES: properties,
@@ -357,34 +484,42 @@ class RequestBody(object):
             for name, property in self._content.items()
         }
 
-    def _get_required_properties(self, content):
-        return [property.name
-                for property in content.values() if property.required]
-
 
 @functools.total_ordering
 class PathParameter(object):
+    __slots__ = ('_in', '_name', '_schema_name', '_required', '_description',
+                 '_datatype', '_style', '_explode', '_spec', '_session',
+                 '_default', '_serialize_into', '_serialize_value', '_schema')
+
     def __init__(self, spec={}, session=None):
         # TODO: Rework PathParameter to work based on the saved spec
         self._in = spec[OpenAPIKeyWord.IN]
         self._init_name(spec[OpenAPIKeyWord.NAME])
         self._required = spec.get(OpenAPIKeyWord.REQUIRED, False)
         self._description = spec.get(OpenAPIKeyWord.DESCRIPTION, "")
-        self._datatype = get_dict_value(
-                            spec,
-                            [OpenAPIKeyWord.SCHEMA, OpenAPIKeyWord.TYPE],
-                            OpenAPIKeyWord.STRING)
+        self._datatype = (spec.get(OpenAPIKeyWord.SCHEMA) or {}).get(
+                            OpenAPIKeyWord.TYPE, OpenAPIKeyWord.STRING)
         self._style = spec.get(OpenAPIKeyWord.STYLE,
                                self.default_style(self._in))
         self._explode = spec.get(OpenAPIKeyWord.EXPLODE,
                                  self.default_explode(self._style))
         self._spec = spec
         self._session = session
-        self._default = None
+        self._default = _MISSING
+        self._schema = None
+
+        # Query parameters are the only ones with a style dependent
+        # serialization, choose the serializers once
+        self._serialize_value = _value_serializers.get(self._datatype, str)
+        if self._in == OpenAPIKeyWord.QUERY:
+            self._serialize_into = self._serialize_query_into
+        else:
+            self._serialize_into = self._serialize_value_into
 
     def _init_name(self, name):
-        self._name = name.replace('-', '_')
-        self._schema_name = name
+        # Names are looked up in kwargs and used as request dict keys
+        self._name = sys.intern(name.replace('-', '_'))
+        self._schema_name = sys.intern(name)
 
     @property
     def name(self):
@@ -394,6 +529,10 @@ class PathParameter(object):
     def schema_name(self):
         return self._schema_name
 
+    @property
+    def location(self):
+        return self._in
+
     @property
     def required(self):
         return self._required or self._in == OpenAPIKeyWord.PATH
@@ -408,51 +547,63 @@ class PathParameter(object):
 
     @property
     def default(self):
-        if self._default is None:
+        if self._default is _MISSING:
             self._default = self._session.get_default(self._name)
         return self._default
 
     @property
     def schema(self):
-        result = {}
-        for name, value in self._spec.items():
-            if OpenAPIKeyWord.SCHEMA == name:
-                result.update({k: v for k, v in value.items()})
-            elif OpenAPIKeyWord.NAME == name:
-                continue
-            else:
-                result[name] = value
+        if self._schema is None:
+            result = {}
+            for name, value in self._spec.items():
+                if OpenAPIKeyWord.SCHEMA == name:
+                    result.update({k: v for k, v in value.items()})
+                elif OpenAPIKeyWord.NAME == name:
+                    continue
+                else:
+                    result[name] = value
+            self._schema = result
 
-        return result
+        return self._schema
 
-    def serialize(self, path_params, query_params, headers, cookies, kwargs):
-        if self._name not in kwargs and not self.default:
+    def serialize(self, target, kwargs):
+        """
+        Move parameter's value from kwargs into the target dictionary
+        that corresponds to the parameter's location
+        """
+        value = kwargs.pop(self._name, _MISSING)
+        if value is _MISSING:
+            return self.serialize_default(target)
+
+        self._serialize_into(target, value)
+        return True
+
+    def serialize_default(self, target):
+        """
+        Put parameter's default value into the target dictionary, used
+        when the parameter's argument is not provided
+        """
+        # Session defaults, i.e. account_id, may require authentication,
+        # only look them up when the argument is not provided
+        value = self.default
+        if not value:
             if self._required:
                 raise ValueError(f"'{self._name}' is required")
             return
 
-        raw_value = kwargs.pop(self._name, self.default)
-
-        value = serialize_value(
-                self._datatype,
-                raw_value)
-
-        if self._in == OpenAPIKeyWord.PATH:
-            path_params[self.schema_name] = value
-        elif self._in == OpenAPIKeyWord.QUERY:
-            new_query_params = self.serialize_query_parameter(self._style,
-                                                              self._explode,
-                                                              self._name,
-                                                              self._datatype,
-                                                              raw_value)
-            query_params.update(new_query_params)
-        elif self._in == OpenAPIKeyWord.HEADER:
-            headers[self.schema_name] = value
-        elif self._in == OpenAPIKeyWord.COOKIE:
-            cookies[self.schema_name] = value
-
+        self._serialize_into(target, value)
         return True
 
+    def _serialize_value_into(self, target, value):
+        target[self._schema_name] = self._serialize_value(value)
+
+    def _serialize_query_into(self, target, value):
+        target.update(self.serialize_query_parameter(self._style,
+                                                     self._explode,
+                                                     self._name,
+                                                     self._datatype,
+                                                     value))
+
     @classmethod
     def default_style(cls, parameter_in):
         if parameter_in == OpenAPIKeyWord.QUERY:
@@ -479,10 +630,7 @@ class PathParameter(object):
         # https://github.com/OAI/OpenAPI-Specification/blob/master/versions/3.0.3.md#style-examples
         # https://swagger.io/docs/specification/serialization/#query
         # TODO: Serialize deepObject style
-        valid_styles = [OpenAPIKeyWord.PARAMETER_STYLE_FORM,
-                        OpenAPIKeyWord.PARAMETER_STYLE_SPACE_DELIMITED,
-                        OpenAPIKeyWord.PARAMETER_STYLE_PIPE_DELIMITED]
-        if style not in valid_styles:
+        if style not in _QUERY_PARAMETER_STYLES:
             raise ValueError(f"{name} query parameter has invalid style: "
                              f"{style}")
             return
@@ -507,6 +655,8 @@ class PathParameter(object):
                     delimiter = ","
                 return {name: delimiter.join(value)}
         elif datatype == OpenAPIKeyWord.BOOLEAN:
+            if type(value) is bool:
+                return {name: _boolean_strings[value]}
             return {name: str(value).lower()}
         else:
             return {name: value}
@@ -567,8 +717,11 @@ class PathParameter(object):
 
 
 class Operation(object):
+    __slots__ = ('_path', '_params', '_summary', '_description', '_method',
+                 '_spec', '_body', '_response', '_session', '_server',
+                 '_operation_id', '_client', '__name__', '_signature', '_doc',
+                 '_format_path', '_call', '_schema')
     _internal_param_prefix = "_"
-    _call = None
 
     def __init__(self,
                  path,
@@ -596,8 +749,11 @@ class Operation(object):
         self.__name__ = self._operation_id
         self._signature = None
         self._doc = None
+        self._schema = None
+        self._format_path = _compile_path_template(path)
+        self._call = self._gen_call()
 
-        logger.debug(f"Initilized {self._operation_id} operation.")
+        logger.debug("Initilized %s operation.", self._operation_id)
 
     @property
     def spec(self):
@@ -628,16 +784,21 @@ class Operation(object):
         return self._body
 
     def url(self, **kwargs):
-        return self._server.url + self._path.format(**kwargs)
+        return self._server.url + self._format_path(kwargs)
 
     def get_schema(self):
+        # Operations are immutable, the schema is built on first use
+        if self._schema is None:
+            self._schema = self._make_schema()
+        # Callers get their own copy of the cached schema
+        return dict(self._schema)
+
+    def _make_schema(self):
         result = {
             OpenAPIKeyWord.OPERATION_ID: self.operation_id,
             OpenAPIKeyWord.DESCRIPTION: self.description
         }
-        params_schema = {}
-        for param in self.params:
-            params_schema.update({param.name: param.schema})
+        params_schema = {param.name: param.schema for param in self.params}
 
         if self.body:
             schema = self.body.get_schema()
@@ -664,6 +825,27 @@ class Operation(object):
         return result
 
     def _gen_call(self):
+        # Everything below is fixed for the lifetime of the operation,
+        # bind it once instead of resolving attributes on every request
+        operation_id = self._operation_id
+        method = self._method
+        # Flatten parameters into (name, target index, serializers) rows
+        # in location order, targets are path params, query params,
+        # headers and cookies, so that a single loop serializes them all
+        params_spec = tuple(
+            (param.name, index,
+             param._serialize_into, param.serialize_default)
+            for index, location in enumerate(_PARAMETER_LOCATIONS)
+            for param in self._get_location_params(location)
+        )
+        body = self._body
+        has_body = body is not None
+        server = self._server
+        session = self._session
+        format_path = self._format_path
+        prefix = self._internal_param_prefix
+        prefix_len = len(prefix)
+
         def f(**kwargs):
             path_params = {}
             params = {}
@@ -672,43 +854,61 @@ class Operation(object):
             account_id = kwargs.get('account_id')
 
             if account_id:
-                self._server.update_url(account_id)
+                server.update_url(account_id)
 
-            logger.debug(
-                    f"{self.operation_id} called " +
-                    f"with {kwargs} arguments")
+            logger.debug("%s called with %s arguments", operation_id, kwargs)
             # Set operation specific parameters
-            for param in self._params:
-                param.serialize(path_params, params, headers, cookies, kwargs)
-
-            if self._body:
-                self._body.serialize(headers, kwargs)
-
-            # collect internal params
-            for k in kwargs:
-                if not k.startswith(self._internal_param_prefix):
-                    continue
-                kwargs[
-                    k[len(self._internal_param_prefix) :]  # noqa: E203
-                ] = kwargs.pop(k)
-
-            kwargs.setdefault("params", {}).update(params)
-            kwargs.setdefault("headers", {}).update(headers)
-            kwargs.setdefault("cookies", {}).update(cookies)
+            targets = (path_params, params, headers, cookies)
+            for name, index, serialize_into, serialize_default \
+                    in params_spec:
+                value = kwargs.pop(name, _MISSING)
+                if value is _MISSING:
+                    serialize_default(targets[index])
+                else:
+                    serialize_into(targets[index], value)
+
+            if has_body:
+                body.serialize(headers, kwargs)
+
+            # collect internal params, i.e. _allow_redirects is passed
+            # on to the session as allow_redirects
+            # kwargs are usually exhausted by the parameters by now
+            if kwargs:
+                internal_params = [k for k in kwargs
+                                   if k[:prefix_len] == prefix]
+                for k in internal_params:
+                    kwargs[k[prefix_len:]] = kwargs.pop(k)
+
+            # Merge into the caller's _params, _headers and _cookies, or
+            # hand ours over when there are none. Always pass all three,
+            # the session fills in headers.
+            if "params" in kwargs:
+                kwargs["params"].update(params)
+            else:
+                kwargs["params"] = params
+            if "headers" in kwargs:
+                kwargs["headers"].update(headers)
+            else:
+                kwargs["headers"] = headers
+            if "cookies" in kwargs:
+                kwargs["cookies"].update(cookies)
+            else:
+                kwargs["cookies"] = cookies
 
-            return self._session.request(
-                self._method, self.url(**path_params), **kwargs
+            return session.request(
+                method, server.url + format_path(path_params), **kwargs
             )
 
         return f
 
+    def _get_location_params(self, location):
+        return tuple(p for p in self._params if p.location == location)
+
     def __call__(self, *args, **kwargs):
-        if not self._call:
-            self._call = self._gen_call()
         try:
             return self._call(*args, **kwargs)
         except AlmdrlibValueError as e:
-            raise AlmdrlibValueError(f'{self} failed {e}')
+            raise AlmdrlibValueError(f'{self} failed {e}', schema=e.schema)
 
     def __repr__(self):
         return f"<{self._client.name}.{self.operation_id}: " \
@@ -788,10 +988,9 @@ class Client(object):
 
     def load_service_spec(self, service_name, version=None, variables=None):
         logger.debug(
-            f"Initializing client for '{self._name}' " +
-            f"Spec: '{service_name}' Variables: '{variables}'")
-        spec = alsdkdefs.load_service_spec(service_name, Config.get_api_dir(),
-                                           version)
+            "Initializing client for '%s' Spec: '%s' Variables: '%s'",
+            self._name, service_name, variables)
+        spec = _load_service_spec(service_name, Config.get_api_dir(), version)
         self.load_spec(spec, variables)
 
     @property
@@ -823,27 +1022,20 @@ class Client(object):
         return self._spec
 
     def load_spec(self, spec, variables):
-        if not all(
-            [
-                i in spec
-                for i in [
-                    OpenAPIKeyWord.OPENAPI,
-                    OpenAPIKeyWord.INFO,
-                    OpenAPIKeyWord.PATHS,
-                ]
-            ]
-        ):
-            raise ValueError("Invalid OpenAPI document")
-
-        self._spec = spec.copy()
-        _spec = spec.copy()
-
-        self._info = _spec.pop(OpenAPIKeyWord.INFO)
-
-        servers = _spec.pop(OpenAPIKeyWord.SERVERS, [])
-        for key in _spec:
-            rkey = key.replace("-", "_")
-            self.__setattr__(rkey, _spec[key])
+        missing = [key for key in _REQUIRED_SPEC_KEYS if key not in spec]
+        if missing:
+            raise ValueError(f"Invalid OpenAPI document, missing {missing}")
+
+        # The spec is shared between clients and must not be modified
+        self._spec = spec
+        self._info = spec[OpenAPIKeyWord.INFO]
+
+        servers = spec.get(OpenAPIKeyWord.SERVERS, [])
+        self.__dict__.update({
+            key.replace("-", "_"): value
+            for key, value in spec.items()
+            if key not in (OpenAPIKeyWord.INFO, OpenAPIKeyWord.SERVERS)
+        })
 
         self.servers = [
             Server(
@@ -856,9 +1048,15 @@ class Client(object):
 
         if not self._server and self.servers:
             if self._session:
-                self._server = list(
-                        filter(lambda s: self._session.validate_server(s.spec),
-                               self.servers))[0]
+                self._server = next(
+                    (s for s in self.servers
+                     if self._session.validate_server(s.spec)),
+                    None)
+                if self._server is None:
+                    logger.warning(
+                        f"No {self._name} server matches the session's "
+                        "global endpoint, using the first one")
+                    self._server = self.servers[0]
             else:
                 self._server = self.servers[0]
 
@@ -867,10 +1065,13 @@ class Client(object):
     def _initialize_operations(self):
         self._operations = {}
         for path, path_spec in self.paths.items():
+            # Path level parameters end up shared between the path's
+            # operations, build a single PathParameter for each of them
+            path_params = {}
             for method, op_spec in path_spec.items():
                 operation_id = op_spec.get(OpenAPIKeyWord.OPERATION_ID)
-                summary = op_spec.pop(OpenAPIKeyWord.SUMMARY, "")
-                description = op_spec.pop(OpenAPIKeyWord.DESCRIPTION, "")
+                summary = op_spec.get(OpenAPIKeyWord.SUMMARY, "")
+                description = op_spec.get(OpenAPIKeyWord.DESCRIPTION, "")
 
                 if not operation_id:
                     logging.warn(
@@ -880,23 +1081,28 @@ class Client(object):
                     continue
 
                 if operation_id in self._operations:
-                    raise AlmdrlibValueError(f"Duplication {operation_id} \
-                                       specified for {self._name} API")
+                    raise AlmdrlibValueError(
+                        f"Duplicate '{operation_id}' operation id "
+                        f"specified for {self._name} API")
 
                 # Initialize parameters (path, header, query)
-                params = [
-                    PathParameter(spec=s, session=self._session)
-                    for s in op_spec.get(OpenAPIKeyWord.PARAMETERS, [])
-                ]
+                params = []
+                for param_spec in op_spec.get(OpenAPIKeyWord.PARAMETERS, []):
+                    param = path_params.get(id(param_spec))
+                    if param is None:
+                        param = PathParameter(spec=param_spec,
+                                              session=self._session)
+                        path_params[id(param_spec)] = param
+                    params.append(param)
 
                 # Initialize operation's body
                 body = self._initalize_request_body(
-                        op_spec.pop(OpenAPIKeyWord.REQUEST_BODY, None)
+                        op_spec.get(OpenAPIKeyWord.REQUEST_BODY)
                     )
 
                 # Initialize operation's response
                 response = OperationResponse(
-                        op_spec.pop(OpenAPIKeyWord.RESPONSES, None)
+                        op_spec.get(OpenAPIKeyWord.RESPONSES)
                     )
 
                 self._operations[operation_id] = Operation(
@@ -919,16 +1125,16 @@ class Client(object):
             return None
 
         request_body = RequestBody(
-                required=body_spec.pop(OpenAPIKeyWord.REQUIRED, False),
-                description=body_spec.pop(OpenAPIKeyWord.DESCRIPTION, None),
+                required=body_spec.get(OpenAPIKeyWord.REQUIRED, False),
+                description=body_spec.get(OpenAPIKeyWord.DESCRIPTION),
                 session=self._session)
 
-        content = body_spec.pop(OpenAPIKeyWord.CONTENT, {})
+        content = body_spec.get(OpenAPIKeyWord.CONTENT, {})
         for content_type, content_schema in content.items():
             request_body.add_content(
                     content_type,
-                    content_schema.pop(OpenAPIKeyWord.SCHEMA),
-                    content_schema.pop(OpenAPIKeyWord.X_ALERTLOGIC_SCHEMA, {})
+                    content_schema.get(OpenAPIKeyWord.SCHEMA),
+                    content_schema.get(OpenAPIKeyWord.X_ALERTLOGIC_SCHEMA, {})
             )
         return request_body
 
@@ -944,6 +1150,282 @@ class Client(object):
         return super().__dir__() + list(self._operations.keys())
 
 
+def _load_service_spec(service_name, api_dir=None, version=None):
+    file_path = _get_spec_file_path(service_name, api_dir, version)
+    stat = os.stat(file_path)
+    return _load_cached_spec_file(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_cached_spec_file(file_path, mtime_ns, size):
+    # Parsing and resolving a service definition is by far the most
+    # expensive part of a client construction, so do it once per process
+    # for as long as the file's modification time and size are unchanged
+    return _load_spec_file(file_path)
+
+
+def _get_spec_file_path(service_name, api_dir=None, version=None):
+    servicedef = alsdkdefs.list_services(api_dir).get(service_name)
+    versions = servicedef and _get_spec_versions(
+        service_name, servicedef.get_files_path())
+    if not versions:
+        raise FileNotFoundError(
+                f"Service {service_name} definition files has not been found")
+
+    if not version:
+        version = max(versions)
+    elif version[:1] == "v":
+        version = version[1:]
+
+    try:
+        return versions[int(version)]
+    except (KeyError, ValueError):
+        raise FileNotFoundError(
+                f"Version {version} of {service_name} service "
+                "definition has not been found") from None
+
+
+def _get_spec_versions(service_name, files_path):
+    '''
+    Returns {version: file_path} of the service's definition files.
+    Directory listings are cached for as long as the directory's
+    modification time is unchanged, i.e. no files are added or removed.
+    '''
+    try:
+        mtime_ns = os.stat(files_path).st_mtime_ns
+    except OSError:
+        return {}
+    return _list_spec_versions(service_name, files_path, mtime_ns)
+
+
+@functools.lru_cache(maxsize=256)
+def _list_spec_versions(service_name, files_path, mtime_ns):
+    versions = {}
+    with os.scandir(files_path) as entries:
+        for entry in entries:
+            match = _SPEC_FILE_NAME_RE.match(entry.name)
+            if match and match.group('service') == service_name:
+                versions[int(match.group('version'))] = entry.path
+    return versions
+
+
+def _load_spec_file(file_path):
+    '''
+    Load, resolve and normalize service definition file. The result is
+    pickled into the current user's cache directory, which loads much
+    faster than parsing and resolving the definitions again, and is used
+    for as long as the digest of the service's definition files is
+    unchanged.
+    '''
+    cache_path = _get_spec_cache_path(file_path)
+    spec = _read_spec_cache(cache_path) if cache_path else None
+    if spec is None:
+        spec = _materialize_refs(
+            alsdkdefs.normalize_spec(file_path, _read_spec_file(file_path)))
+        if cache_path:
+            _write_spec_cache(cache_path, spec)
+    # Unpickled strings are never interned, so keys are interned either way
+    return _intern_keys(spec)
+
+
+def _read_spec_file(file_path):
+    with open(file_path, 'rb') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _get_spec_cache_path(file_path):
+    '''
+    Returns path of the definitions cache. The digest is part of the file
+    name, so that a cache is known to match the definitions before it is
+    unpickled. Returns None when there is no trusted cache directory.
+    '''
+    cache_dir = os.environ.get('ALERTLOGIC_CACHE_DIR') or \
+        almdrlib.constants.DEFAULT_CACHE_DIR
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        trusted = _is_private(os.stat(cache_dir))
+    except OSError as e:
+        logger.debug("Unable to use '%s' definitions cache directory: %s",
+                     cache_dir, e)
+        return None
+    if not trusted:
+        logger.debug("Ignoring '%s' definitions cache directory, "
+                     "it is writable by other users", cache_dir)
+        return None
+
+    file_name = os.path.basename(file_path)
+    return os.path.join(
+        cache_dir,
+        f"{file_name}.{_get_spec_digest(file_path)}{_SPEC_CACHE_SUFFIX}")
+
+
+def _is_private(file_stat):
+    '''
+    Returns True when the file is owned by the current user and cannot be
+    modified by anyone else, i.e. when unpickling it is safe.
+    '''
+    getuid = getattr(os, 'getuid', None)
+    if getuid is None:
+        # No POSIX ownership, e.g. on Windows
+        return True
+    return file_stat.st_uid == getuid() and \
+        not file_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _get_spec_digest(file_path):
+    '''
+    Digest of all definition files of the service, since definitions
+    reference schemas, parameters and examples in sibling files, and of
+    the cache format and alsdkdefs versions, which produce the result.
+    '''
+    digest = hashlib.sha256(_get_spec_cache_tag())
+    dir_path = os.path.dirname(file_path)
+    for name in sorted(os.listdir(dir_path)):
+        if name.endswith('.yaml'):
+            digest.update(name.encode())
+            with open(os.path.join(dir_path, name), 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_spec_cache_tag():
+    try:
+        from alsdkdefs.version import version as alsdkdefs_version
+    except ImportError:
+        alsdkdefs_version = None
+    return f"{_SPEC_CACHE_VERSION}:{alsdkdefs_version}".encode()
+
+
+def _read_spec_cache(cache_path):
+    try:
+        with open(cache_path, 'rb') as f:
+            if not _is_private(os.fstat(f.fileno())):
+                logger.debug("Ignoring '%s' definitions cache, "
+                             "it is writable by other users", cache_path)
+                return None
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        # Unreadable or written by an incompatible version, rebuild it
+        logger.debug("Ignoring '%s' definitions cache: %s", cache_path, e)
+    return None
+
+
+def _write_spec_cache(cache_path, spec):
+    '''
+    Best effort write of the loaded definitions cache. Pickle keeps
+    subtrees shared by resolved references shared when loaded back.
+    Caches of previous versions of the definitions are removed.
+    '''
+    try:
+        data = pickle.dumps(spec, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, RecursionError) as e:
+        logger.debug("Unable to cache '%s' definitions: %s", cache_path, e)
+        return
+
+    # Write to a new temporary file first, so that concurrent readers
+    # never see a partially written cache
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                     0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("Unable to write '%s' definitions cache: %s",
+                     cache_path, e)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return
+
+    cache_dir, cache_name = os.path.split(cache_path)
+    # Strip the digest and the suffix, leaving '<file name>.'
+    prefix = cache_name[:-len(_SPEC_CACHE_SUFFIX)].rsplit('.', 1)[0] + '.'
+    try:
+        for name in os.listdir(cache_dir):
+            if name != cache_name and name.startswith(prefix) and \
+                    name.endswith(_SPEC_CACHE_SUFFIX):
+                os.remove(os.path.join(cache_dir, name))
+    except OSError as e:
+        logger.debug("Unable to remove stale definitions caches: %s", e)
+
+
+def _materialize_refs(spec):
+    '''
+    Replace local $ref objects left behind by alsdkdefs' resolver
+    with the objects they point to, so that consumers never have to
+    resolve references themselves. Shared subtrees are visited once.
+    '''
+    targets = {}
+
+    def get_target(ref):
+        if ref not in targets:
+            keys = [unquote(k).replace('~1', '/').replace('~0', '~')
+                    for k in ref[2:].split('/')]
+            targets[ref] = get_dict_value(spec, keys)
+        return targets[ref]
+
+    visited = set()
+    stack = [spec]
+    while stack:
+        node = stack.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+
+        for key, value in (node.items() if isinstance(node, dict)
+                           else enumerate(node)):
+            # Follow chains of references, i.e. a $ref to a $ref
+            seen_refs = set()
+            while isinstance(value, dict):
+                ref = value.get(OpenAPIKeyWord.REF)
+                if not isinstance(ref, str) or not ref.startswith('#/') \
+                        or ref in seen_refs:
+                    break
+                target = get_target(ref)
+                if target is None:
+                    break
+                seen_refs.add(ref)
+                value = node[key] = target
+
+            if isinstance(value, (dict, list)):
+                stack.append(value)
+
+    return spec
+
+
+def _intern_keys(spec):
+    '''
+    Intern all mapping keys of the spec in place, so that lookups with
+    OpenAPIKeyWord constants and parameter names compare by identity.
+    '''
+    visited = set()
+    stack = [spec]
+    while stack:
+        node = stack.pop()
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+
+        if isinstance(node, dict):
+            items = [(sys.intern(k) if type(k) is str else k, v)
+                     for k, v in node.items()]
+            node.clear()
+            node.update(items)
+            values = node.values()
+        else:
+            values = node
+
+        stack.extend(v for v in values if isinstance(v, (dict, list)))
+
+    return spec
+
+
 def _normalize_schema(name, schema, required=False):
     properties = schema.get(OpenAPIKeyWord.PROPERTIES)
     if properties and bool(properties):
@@ -962,16 +1444,98 @@ def _normalize_schema(name, schema, required=False):
 
 
 def get_dict_value(dict, list, default=None):
-    length = len(list)
+    for key in list:
+        if not isinstance(dict, Mapping) or key not in dict:
+            return default
+        dict = dict[key]
+    return dict
+
+
+def _compile_path_template(path):
+    '''
+    Returns a function that substitutes path parameters into the path
+    template. Templates without replacement fields always produce
+    the same path, so formatting is skipped for them altogether.
+    '''
+    parsed = list(string.Formatter().parse(path))
+    if all(field is None for _, field, _, _ in parsed):
+        constant_path = ''.join(literal for literal, _, _, _ in parsed)
+        return lambda path_params: constant_path
+
+    return path.format_map
+
+
+def _json_dumps(data):
+    """
+    Encodes request payload as JSON. Uses orjson when it is installed,
+    which returns utf-8 encoded bytes, and falls back to the standard
+    library for anything orjson refuses to encode.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(data)
+
+
+def _get_validator(schema, shared=True):
+    '''
+    Returns validator for the schema. Checking a schema against its
+    metaschema and building a validator is expensive, so validators are
+    shared by all request body parameters with identical schemas.
+
+    Shared schemas are part of the loaded definitions, which are kept for
+    the life of the process, so clients constructed again pass the very
+    same objects and their validators are also looked up by identity.
+    Other schemas, i.e. ones built per parameter, are only looked up by
+    content, since recording them would keep every one of them alive.
+    '''
+    if shared:
+        entry = _validators_by_id.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            return entry[1]
+
+    key = _schema_key(schema)
+    validator = _validators.get(key) if key is not None else None
+    if validator is None:
+        validator_cls = validator_for(schema)
+        validator_cls.check_schema(schema)
+        validator = validator_cls(schema)
+        if key is not None:
+            _validators[key] = validator
+    if shared:
+        _validators_by_id[id(schema)] = (schema, validator)
+    return validator
+
+
+def _schema_key(schema):
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                schema,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
     try:
-        for depth, key in enumerate(list):
-            if depth == length - 1:
-                output = dict[key]
-                return output
-            dict = dict[key]
-    except (KeyError, TypeError):
-        return default
-    return default
+        return json.dumps(schema, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+
+
+def _json_format(data):
+    """
+    Returns indented JSON representation of the data for diagnostics
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2)
 
 
 def update_dict_no_replace(target, source):
@@ -981,12 +1545,7 @@ def update_dict_no_replace(target, source):
 
 
 def serialize_value(datatype, value):
-    if OpenAPIKeyWord.STRING == datatype:
-        return value
-    elif OpenAPIKeyWord.BOOLEAN == datatype:
-        return value and "true" or "false"
-    else:
-        return str(value)
+    return _value_serializers.get(datatype, str)(value)
 
 
 def openapi_type_to_python_data_type(data_type):
@@ -2,12 +2,21 @@
 
 import os.path
 import configparser
+import contextlib
+import functools
+import io
 import logging
+import stat
 import json
 import almdrlib.constants
 from almdrlib.exceptions import AlmdrlibValueError
 from almdrlib.environment import AlEnv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,6 +42,8 @@ class Config():
     ALERTLOGIC_ACCOUNT_ID - Account Id to perform operations against.
     ALERTLOGIC_RESIDENCY - Data Residency when creating new deployments
     ALERTLOGIC_API  - Directory where OpenAPI yaml files reside
+    ALERTLOGIC_CACHE_DIR - Directory where loaded OpenAPI definitions are cached.
+    If not specified, ~/.alertlogic/cache is used
     ALERTLOGIC_SERVICE_NAME - If a (micro)service is built around almdrlib used as identifier
 
     Config File section values
@@ -57,14 +68,15 @@ class Config():
                  service_name=None):
         self._config_file = os.environ.get('ALERTLOGIC_CONFIG')
         self._endpoint_map = None
+        self._endpoint_map_path = None
         self._service_name = service_name
 
         if self._config_file is None:
             self._config_file = almdrlib.constants.DEFAULT_CONFIG_FILE
 
         logger.debug(
-                "Initializing configuration using " +
-                f"'{self._config_file}' configuration file")
+                "Initializing configuration using "
+                "'%s' configuration file", self._config_file)
         if access_key_id or secret_key:
             self._access_key_id = access_key_id
             self._secret_key = secret_key
@@ -106,37 +118,23 @@ class Config():
 
         self._init_al_env_credentials()
 
-        logger.debug("Finished configuraiton initialization. " +
-                     f"access_key_id={self._access_key_id}, " +
-                     f"account_id={self._account_id}, " +
-                     f"global_endpoint={self._global_endpoint}")
+        logger.debug("Finished configuraiton initialization. "
+                     "access_key_id=%s, account_id=%s, global_endpoint=%s",
+                     self._access_key_id, self._account_id,
+                     self._global_endpoint)
 
     def _init_al_env_credentials(self):
         if self._access_key_id is None or self._secret_key is None:
-            try:
-                # attempt ssm first
-                env = AlEnv(self._service_name, "aims_authc", "ssm")
-                self._access_key_id = env.get_parameter('access_key_id', decrypt=True)
-                self._secret_key = env.get_parameter('secret_access_key', decrypt=True)
-            except Exception as e:
-                logger.debug(f"Did not initialise aims credentials via SSM for {self._service_name} because {e}")
-        if self._access_key_id is None or self._secret_key is None:
-            try:
-                # if that doesn't work, attempt dynamodb
-                env = AlEnv(self._service_name, "aims_authc", "dynamodb")
-                self._access_key_id = env.get('access_key_id')
-                self._secret_key = env.get('secret_access_key')
-            except Exception as e:
-                logger.debug(f"Did not initialise aims credentials via dynamodb for {self._service_name} because {e}")
-           
+            credentials = _get_al_env_credentials(self._service_name)
+            if credentials is not None:
+                self._access_key_id, self._secret_key = credentials
 
     def _read_config_file(self):
-        try:
-            read_ok = self._parser.read(self._config_file)
-            return False if self._config_file not in read_ok else True
-        except configparser.MissingSectionHeaderError:
-            raise ConfigException(
-                    f"Invalid format in file {self._config_file}")
+        parser = _read_config_parser(self._config_file)
+        if parser is None:
+            return False
+        self._parser = parser
+        return True
 
     def _initialize_defaults(self):
         self._global_endpoint = \
@@ -166,12 +164,11 @@ class Config():
             almdrlib.constants.DEFAULT_ENDPOINT_MAP_FILE
 
         if self._global_endpoint == "map":
+            # The map is loaded on first use of the endpoint_map property
             if os.path.isabs(self._endpoint_map_file):
-                path = self._endpoint_map_file
+                self._endpoint_map_path = self._endpoint_map_file
             else:
-                path = os.path.join(almdrlib.constants.DEFAULT_CONFIG_DIR, self._endpoint_map_file)
-            with open(path) as json_file:
-                self._endpoint_map = json.load(json_file)
+                self._endpoint_map_path = os.path.join(almdrlib.constants.DEFAULT_CONFIG_DIR, self._endpoint_map_file)
 
         self._residency = \
             self._residency or \
@@ -206,34 +203,21 @@ class Config():
         if not secret_key:
             raise AlmdrlibValueError("Missing secret_key")
 
-        parser = _get_config_parser(almdrlib.constants.DEFAULT_CONFIG_FILE)
-
-        try:
-            parser.add_section(profile)
-        except configparser.DuplicateSectionError:
-            # section alread exists.
-            pass
-        except configparser.ValueError:
-            # almdrlib.constants.DEFAULT_PROFILE was passed as the section name
-            pass
-
-        parser.set(profile, 'access_key_id', access_key_id)
-        parser.set(profile, 'secret_key', secret_key)
-
-        if account_id:
-            parser.set(profile, 'account_id', account_id)
+        with Config.batch_set(profile) as set_option:
+            set_option('access_key_id', access_key_id)
+            set_option('secret_key', secret_key)
 
-        if global_endpoint:
-            parser.set(profile, 'global_endpoint', global_endpoint)
+            if account_id:
+                set_option('account_id', account_id)
 
-        if endpoint_map_file:
-            parser.set(profile, 'endpoint_map_file', endpoint_map_file)
+            if global_endpoint:
+                set_option('global_endpoint', global_endpoint)
 
-        if residency:
-            parser.set(profile, 'residency', residency)
+            if endpoint_map_file:
+                set_option('endpoint_map_file', endpoint_map_file)
 
-        with open(almdrlib.constants.DEFAULT_CONFIG_FILE, 'w') as configfile:
-            parser.write(configfile)
+            if residency:
+                set_option('residency', residency)
 
     @staticmethod
     def set_option(
@@ -242,8 +226,33 @@ class Config():
             profile=almdrlib.constants.DEFAULT_PROFILE):
         parser = _get_config_parser(almdrlib.constants.DEFAULT_CONFIG_FILE)
         parser.set(profile, name, value)
-        with open(almdrlib.constants.DEFAULT_CONFIG_FILE, 'w') as configfile:
-            parser.write(configfile)
+        _write_config_file(almdrlib.constants.DEFAULT_CONFIG_FILE, parser)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def batch_set(profile=almdrlib.constants.DEFAULT_PROFILE):
+        """
+        Set several options of a profile with a single write of the
+        configuration file, once the block completes without errors.
+        The profile section is added if it doesn't exist::
+
+            with Config.batch_set('production') as set_option:
+                set_option('account_id', '12345678')
+                set_option('residency', 'us')
+        """
+        parser = _get_config_parser(almdrlib.constants.DEFAULT_CONFIG_FILE)
+
+        try:
+            parser.add_section(profile)
+        except configparser.DuplicateSectionError:
+            # section alread exists.
+            pass
+        except ValueError:
+            # almdrlib.constants.DEFAULT_PROFILE was passed as the section name
+            pass
+
+        yield functools.partial(parser.set, profile)
+        _write_config_file(almdrlib.constants.DEFAULT_CONFIG_FILE, parser)
 
     @property
     def profile(self):
@@ -259,6 +268,11 @@ class Config():
 
     @property
     def endpoint_map(self):
+        if self._endpoint_map is None and self._endpoint_map_path:
+            with open(self._endpoint_map_path, 'rb') as json_file:
+                data = json_file.read()
+            self._endpoint_map = \
+                orjson.loads(data) if orjson is not None else json.loads(data)
         return self._endpoint_map
 
     @property
@@ -272,13 +286,108 @@ class Config():
 
 
 def _get_config_parser(config_file=almdrlib.constants.DEFAULT_CONFIG_FILE):
-    parser = configparser.ConfigParser()
+    parser = _parse_config(config_file)
+    if parser is None:
+        raise AlmdrlibValueError(
+            f"'{config_file}' doesn't exist")
+    return parser
+
+
+@functools.lru_cache(maxsize=32)
+def _get_al_env_credentials(service_name):
+    """
+    Returns (access_key_id, secret_key) of the service stored in SSM or,
+    failing that, in dynamodb. Returns None if neither can be queried.
+    Looking them up creates AWS clients and makes network calls, so the
+    outcome is kept for the life of the process.
+    """
+    credentials = None
+    try:
+        # attempt ssm first
+        env = AlEnv(service_name, "aims_authc", "ssm")
+        credentials = (env.get_parameter('access_key_id', decrypt=True),
+                       env.get_parameter('secret_access_key', decrypt=True))
+    except Exception as e:
+        logger.debug("Did not initialise aims credentials via SSM for %s because %s", service_name, e)
+    if credentials is None or None in credentials:
+        try:
+            # if that doesn't work, attempt dynamodb
+            env = AlEnv(service_name, "aims_authc", "dynamodb")
+            credentials = (env.get('access_key_id'),
+                           env.get('secret_access_key'))
+        except Exception as e:
+            logger.debug("Did not initialise aims credentials via dynamodb for %s because %s", service_name, e)
+    return credentials
+
+
+def _write_config_file(config_file, parser):
+    """
+    Write configuration file unless its content is unchanged. The file is
+    replaced atomically by a temporary file with the same permissions,
+    so readers never see a partially written configuration. Symbolic
+    links are resolved first, so that the file they point to is updated.
+    """
+    config_file = os.path.realpath(config_file)
+    buffer = io.StringIO()
+    parser.write(buffer)
+    data = buffer.getvalue()
+
+    try:
+        mode = stat.S_IMODE(os.stat(config_file).st_mode)
+        with open(config_file) as f:
+            if f.read() == data:
+                return
+    except OSError:
+        mode = 0o600
+
+    tmp_path = f"{config_file}.{os.getpid()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with open(fd, 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, config_file)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    finally:
+        _parse_config_file.cache_clear()
+
+
+def _read_config_parser(config_file):
+    """
+    Returns parsed configuration file or None if it can't be read.
+    Parsed files are shared by Config instances, which only read them,
+    for as long as the file's modification time and size are unchanged.
+    """
+    try:
+        stat = os.stat(config_file)
+    except OSError:
+        return None
+    return _parse_config_file(config_file, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_config_file(config_file, mtime_ns, size):
+    return _parse_config(config_file)
+
+
+def _parse_config(config_file):
+    """
+    Parses configuration file with a single buffered read. Like
+    ConfigParser.read(), returns None if the file can't be opened.
+    """
     try:
-        read_ok = parser.read(config_file)
-        if config_file not in read_ok:
-            raise AlmdrlibValueError(
-                f"'{config_file}' doesn't exist")
+        with open(config_file) as f:
+            data = f.read()
+    except OSError:
+        return None
 
+    parser = configparser.ConfigParser()
+    try:
+        parser.read_string(data, source=config_file)
     except configparser.MissingSectionHeaderError:
         raise ConfigException(
                 f"Invalid format in file {config_file}")
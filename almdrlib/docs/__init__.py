@@ -28,5 +28,7 @@ def make_documentation(dir, session=None):
 
         service_doc_path = os.path.join(
             doc_path, name + '.rst')
-        with open(service_doc_path, 'w+') as f:
-            f.writelines(f"{line}\n" for line in doc)
+        # Join the lines first, writing them one by one goes through
+        # the io layer for every line
+        with open(service_doc_path, 'w') as f:
+            f.write('\n'.join(doc) + '\n')
@@ -1,10 +1,11 @@
+import functools
 import json
 import logging
 import itertools
 try:
-    from m2r2 import convert
+    from m2r2 import convert as convert_markdown
 except Exception:
-    def convert(text):
+    def convert_markdown(text):
         return text
 
 from alsdkdefs import OpenAPIKeyWord
@@ -12,6 +13,13 @@ from alsdkdefs import OpenAPIKeyWord
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def convert(text):
+    # Descriptions of shared parameters and schemas repeat across
+    # operations, and most are empty
+    return convert_markdown(text) if text else text
+
+
 class ServiceDocGenerator(object):
     def __init__(self,
                  service_name,
@@ -21,6 +29,7 @@ class ServiceDocGenerator(object):
         self._initial_indent = initial_indent
         self._indent_increment = indent_increment
         self._service_name = service_name
+        self._class_name = service_name.capitalize()
         self._spec = spec
 
     def _indent(self, indent, count=1):
@@ -34,7 +43,7 @@ class ServiceDocGenerator(object):
         return iter(itertools.chain(*generators))
 
     def _make_header(self):
-        yield self._service_name.capitalize()
+        yield self._class_name
         yield '*' * len(self._service_name)
         yield ''
 
@@ -48,35 +57,38 @@ class ServiceDocGenerator(object):
         yield '======'
 
         indent = self._initial_indent
-        c_name = self._service_name.capitalize()
+        code_indent = self._indent(indent)
+        c_name = self._class_name
         yield f'.. py:class:: {c_name}.Client'
         yield ''
         yield f"{indent}A client object representing '{c_name}' Service::"
         yield ''
 
-        yield f'{indent*2}import almdrlib'
+        yield f'{code_indent}import almdrlib'
         yield ''
-        yield f"{indent*2}client = almdrlib.client('{self._service_name}')"
+        yield f"{code_indent}client = almdrlib.client('{self._service_name}')"
         yield ''
 
         yield f'{indent}Available methods:'
+        method_ref = f'{indent}*   :py:meth:`~{c_name}.Client.'
         for op_name in self._spec['operations'].keys():
             yield ''
-            yield f'{indent}*   :py:meth:`~{c_name}.Client.{op_name}`'
+            yield f'{method_ref}{op_name}`'
             yield ''
 
     def _make_methods(self):
         indent = self._initial_indent
+        description_indent = f'{indent}{indent}'
+        syntax_indent = self._indent(indent)
         for op_name, op_spec in self._spec['operations'].items():
             yield ''
             yield f'{indent}.. py:method:: {op_name}(**kwargs)'
             for line in convert(op_spec.get('description', "")).splitlines():
-                yield f'{indent}{indent}{line}'
+                yield f'{description_indent}{line}'
 
             parameters = op_spec.get('parameters', {})
-            for line in self._make_request_syntax(
-                    op_name, parameters, self._indent(indent)):
-                yield line
+            yield from self._make_request_syntax(
+                    op_name, parameters, syntax_indent)
 
             yield from self._make_request_parameters(
                     op_name, parameters, indent)
@@ -134,12 +146,12 @@ class ServiceDocGenerator(object):
             if name == 'content_type':
                 yield from self._make_content_type(
                         op_name,
-                        spec.pop('x-alertlogic-payload-content'),
+                        spec.get('x-alertlogic-payload-content'),
                         indent=indent)
 
             elif 'content' in spec:
                 yield from self._make_request_body_parameter(
-                        spec.pop('content'),
+                        spec.get('content'),
                         name,
                         indent=self._indent(indent)
                     )
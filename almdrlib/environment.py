@@ -43,9 +43,7 @@ SSM usage:
 '''
 
 import json
-import boto3
 import os
-import botocore
 
 
 class AlEnvException(Exception):
@@ -71,6 +69,9 @@ class AlEnv:
         self.region = AlEnv._get_region()
         self.stack_name = AlEnv._get_stack_name()
         self.table_name = AlEnv._table_name(self.region, self.stack_name)
+        # boto3 is imported on first use, it dominates 'import almdrlib' time
+        import boto3
+        import botocore.exceptions
         try:
             self.dynamodb = boto3.resource('dynamodb')
             self.ssm = boto3.client('ssm')
@@ -99,6 +100,7 @@ class AlEnv:
     def get_parameter(self, key, default=None, decrypt=False):
         if "ssm" not in self.source:
             raise AlmdrlibSourceNotEnabledError("ssm is not enabled for this environment")
+        import botocore.exceptions
         try:
             parameter = self.ssm.get_parameter(Name=self._make_ssm_key(key), WithDecryption=decrypt)
         except self.ssm.exceptions.ParameterNotFound:
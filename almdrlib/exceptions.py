@@ -16,8 +16,10 @@ class AlmdrlibTypeError(AlmdrlibException, TypeError):
 
 
 class AlmdrlibValueError(AlmdrlibException, ValueError):
-    def __init__(self, msg):
+    def __init__(self, msg, schema=None):
         super().__init__(msg)
+        # Schema the value failed to validate against, if any
+        self.schema = schema
 
 
 class AlmdrlibKeyError(AlmdrlibException, KeyError):
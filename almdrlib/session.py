@@ -121,7 +121,6 @@ class Session():
         self._account_id = self._config.account_id
         self._residency = self._config.residency
         self._global_endpoint = self._config.global_endpoint
-        self._endpoint_map = self._config.endpoint_map
         self._global_endpoint_url = Region.get_global_endpoint(self._global_endpoint)
         self._raise_for_status = kwargs.get('raise_for_status')
 
@@ -132,11 +131,10 @@ class Session():
 
         logger.debug(
                 "Initialized session. "
-                f"access_key_id={self._access_key_id}, "
-                f"account_id={self._account_id}, "
-                f"profile={profile}, "
-                f"global_endpoint={self._global_endpoint}, "
-                f"residency={self._residency}"
+                "access_key_id=%s, account_id=%s, profile=%s, "
+                "global_endpoint=%s, residency=%s",
+                self._access_key_id, self._account_id, profile,
+                self._global_endpoint, self._residency
             )
 
     def _authenticate(self):
@@ -148,17 +146,15 @@ class Session():
 
         if not self._token:
             if self._access_key_id == "skip" and self._secret_key == "skip":
-                logger.info(
-                        f"Skipping authentication."
-                    )
+                logger.info("Skipping authentication.")
                 self._token = ""
                 self._account_id = ""
                 self._account_name = ""
                 self._user_id = ""
                 return
             logger.info(
-                    f"Authenticating '{self._access_key_id}' " +
-                    f"user against '{self._global_endpoint_url}' endpoint."
+                    "Authenticating '%s' user against '%s' endpoint.",
+                    self._access_key_id, self._global_endpoint_url
                 )
             try:
                 self._session.auth = (self._access_key_id, self._secret_key)
@@ -170,15 +166,15 @@ class Session():
                 account_info = auth_info["authentication"]["account"]
                 self._token = auth_info["authentication"]["token"]
                 self._user_id = auth_info["authentication"]["user"]["id"]
-                logger.info(f'Authenticated user {auth_info["authentication"]["user"]["id"]}')
+                logger.info('Authenticated user %s', self._user_id)
 
             except requests.exceptions.HTTPError as e:
                 raise AuthenticationException(f"invalid http response {e}")
             except (KeyError, TypeError, ValueError):
                 raise AuthenticationException("token not found in response")
         else:
-            logger.info("Authenticating using aims token " +
-                        f"against '{self._global_endpoint_url}' endpoint.")
+            logger.info("Authenticating using aims token "
+                        "against '%s' endpoint.", self._global_endpoint_url)
             try:
                 response = self._session.get(
                         f"{self._global_endpoint_url}/aims/v1/token_info",
@@ -241,10 +237,9 @@ class Session():
                              })
 
         _client = ServiceClient(service_name, session=self, version=version)
-        logger.debug(
-            "Created " +
-            f"{_client.__class__.__module__}.{_client.__class__.__name__}" +
-            " class instance")
+        logger.debug("Created %s.%s class instance",
+                     _client.__class__.__module__,
+                     _client.__class__.__name__)
         return _client
 
     @lru_cache(maxsize=128)
@@ -280,7 +275,8 @@ class Session():
         return "https://{}".format(response.json()[service_name])
 
     def get_mapped_url(self, service_name, account_id):
-        map = self._endpoint_map
+        # The endpoint map is only loaded once a mapped url is needed
+        map = self._config.endpoint_map
         return map[service_name]
 
     def request(
@@ -293,15 +289,15 @@ class Session():
             **kwargs):
 
         # it's too easy to include the AIMS token when pasting debug logs, so redact it in
-        # the logging statement.
-        headers.update({'x-aims-auth-token': "REDACTED"})
-
-        logger.debug(f"Calling '{method}' method. " +
-                     f"URL: '{url}'. " +
-                     f"Params: '{params}' " +
-                     f"Headers: '{headers}' " +
-                     f"Cookies: '{cookies}' " +
-                     f"Args: '{kwargs}'")
+        # the logging statement. The message is formatted right away, before the token is set.
+        if logger.isEnabledFor(logging.DEBUG):
+            headers.update({'x-aims-auth-token': "REDACTED"})
+            logger.debug(f"Calling '{method}' method. " +
+                         f"URL: '{url}'. " +
+                         f"Params: '{params}' " +
+                         f"Headers: '{headers}' " +
+                         f"Cookies: '{cookies}' " +
+                         f"Args: '{kwargs}'")
 
         headers.update({'x-aims-auth-token': self.token})
 
@@ -314,9 +310,10 @@ class Session():
                 **kwargs)
         if self._raise_for_status:
             response.raise_for_status()
-        logger.debug(f"'{method}' method for URL: '{url}' returned "
-                     f"'{response.status_code}' status code "
-                     f"in '{response.elapsed.total_seconds()}' seconds")
+        logger.debug("'%s' method for URL: '%s' returned "
+                     "'%s' status code in '%s' seconds",
+                     method, url, response.status_code,
+                     response.elapsed.total_seconds())
         return response
 
     def get_default(self, name):
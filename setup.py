@@ -97,6 +97,9 @@ setup(
             'pycodestyle>=2.3.1',
             'jsonschema[format_nongpl]==3.2.0'
         ],
+        'speedups': [
+            'orjson>=3'
+        ],
     },
     keywords=['alertlogic-sdk', 'alertlogic-sdk-python', 'alertlogic-mdr-sdk', 'almdrlib', 'alertlogic']
 )
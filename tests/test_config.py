@@ -1,6 +1,11 @@
+import os
+import re
+import shutil
+import tempfile
 import unittest
+from unittest import mock
+from almdrlib.config import Config
 from almdrlib.session import Session
-import re
 
 MOCK_AUTH = {
     "authentication": {
@@ -75,6 +80,87 @@ class TestConf(unittest.TestCase):
                                             (200, {"aetuner":"api.alertlogic.com"})})
         assert session.get_url("aetuner", "1234567") == "https://api.alertlogic.com"
 
+    def test_config_file_cache(self):
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_file = os.path.join(tmp_dir, 'config')
+            shutil.copy(os.path.join(dir_path, 'config'), config_file)
+            with mock.patch.dict(os.environ, {'ALERTLOGIC_CONFIG': config_file}):
+                config = Config(profile='production')
+                assert config.account_id == '123456789'
+                assert Config(profile='production')._parser is config._parser
+
+                # Changed files are parsed again
+                with open(config_file, 'a') as f:
+                    f.write('\n[other]\naccess_key_id=G\nsecret_key=H\naccount_id=5\n')
+                assert Config(profile='other').account_id == '5'
+
+    def test_endpoint_map(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_file = os.path.join(tmp_dir, 'config')
+            map_file = os.path.join(tmp_dir, 'endpoint_map.json')
+            with open(config_file, 'w') as f:
+                f.write('[default]\naccess_key_id=A\nsecret_key=B\n'
+                        f'global_endpoint=map\nendpoint_map_file={map_file}\n')
+            with mock.patch.dict(os.environ, {'ALERTLOGIC_CONFIG': config_file}):
+                # The map is only read when it is used
+                config = Config()
+                with open(map_file, 'w') as f:
+                    f.write('{"aetuner": "http://localhost:8080"}')
+                assert config.endpoint_map == {"aetuner": "http://localhost:8080"}
+
+    def test_config_file_writes(self):
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config_file = os.path.join(tmp_dir, 'config')
+            shutil.copy(os.path.join(dir_path, 'config'), config_file)
+            os.chmod(config_file, 0o600)
+            with mock.patch('almdrlib.constants.DEFAULT_CONFIG_FILE', config_file), \
+                    mock.patch.dict(os.environ, {'ALERTLOGIC_CONFIG': config_file}):
+                with Config.batch_set('staging') as set_option:
+                    set_option('access_key_id', 'G')
+                    set_option('secret_key', 'H')
+                    set_option('account_id', '5')
+                assert Config(profile='staging').account_id == '5'
+                assert os.stat(config_file).st_mode & 0o777 == 0o600
+
+                Config.configure(access_key_id='A', secret_key='B',
+                                 account_id='6')
+                assert Config().account_id == '6'
+
+                # Unchanged configuration is not written again
+                mtime_ns = os.stat(config_file).st_mtime_ns
+                Config.set_option('account_id', '5', profile='staging')
+                assert os.stat(config_file).st_mtime_ns == mtime_ns
+                assert os.listdir(tmp_dir) == ['config']
+
+    def test_config_file_symlink(self):
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target_file = os.path.join(tmp_dir, 'dotfiles_config')
+            shutil.copy(os.path.join(dir_path, 'config'), target_file)
+            config_file = os.path.join(tmp_dir, 'config')
+            os.symlink(target_file, config_file)
+            with mock.patch('almdrlib.constants.DEFAULT_CONFIG_FILE', config_file), \
+                    mock.patch.dict(os.environ, {'ALERTLOGIC_CONFIG': config_file}):
+                Config.set_option('account_id', '5', profile='production')
+                assert os.path.islink(config_file)
+                assert Config(profile='production').account_id == '5'
+                with open(target_file) as f:
+                    assert re.search(r'account_id\s*=\s*5', f.read())
+
+    def test_al_env_credentials_cache(self):
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                mock.patch.dict(os.environ, {'ALERTLOGIC_CONFIG': os.path.join(tmp_dir, 'missing')}), \
+                mock.patch('almdrlib.config.AlEnv', side_effect=Exception('no aws')) as al_env:
+            os.environ.pop('ALERTLOGIC_ACCESS_KEY_ID', None)
+            os.environ.pop('ALERTLOGIC_SECRET_KEY', None)
+            for _ in range(2):
+                config = Config(service_name='test_al_env_credentials_cache')
+                assert config.get_auth() == (None, None)
+            # Queried SSM and dynamodb once
+            assert al_env.call_count == 2
+
 
 if __name__ == '__main__':
     unittest.main()
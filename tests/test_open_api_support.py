@@ -1,18 +1,52 @@
 #!/usr/bin/env python
 import os
 import json
+import pickle
+import shutil
+import sys
+import tempfile
 
 """Tests for `alertlogic-sdk-python` package."""
 
 import unittest
+from unittest import mock
 
 from almdrlib.session import Session
 from almdrlib.client import Client
+from almdrlib.exceptions import AlmdrlibValueError
 from almdrlib.client import Config
 from almdrlib.client import Operation
+from almdrlib.client import PathParameter
+from almdrlib.client import _materialize_refs
+from almdrlib.client import _load_spec_file
+from almdrlib.client import _load_service_spec
+from almdrlib.client import _get_spec_cache_path
+from almdrlib.client import _compile_path_template
+from almdrlib.client import _validators_by_id
 from alsdkdefs import OpenAPIKeyWord
 
 
+class MockResponse():
+    status_code = 200
+
+    class elapsed():
+        @staticmethod
+        def total_seconds():
+            return 0
+
+    def raise_for_status(self):
+        return None
+
+
+class RecordingSession():
+    """Stands in for requests.Session and records the last request"""
+    def request(self, method, url, **kwargs):
+        self.method = method
+        self.url = url
+        self.kwargs = kwargs
+        return MockResponse()
+
+
 class TestSdk_open_api_support(unittest.TestCase):
     """Tests for `python_boilerplate` package."""
 
@@ -93,4 +127,218 @@ class TestSdk_open_api_support(unittest.TestCase):
             kwargs = {'payload': payload}
             headers = {'content-type': content_type}
             operation.body.serialize(headers, kwargs)
-            self.assertEqual(kwargs['data'], json.dumps(payload))
+            self.assertEqual(json.loads(kwargs['data']), payload)
+
+    def test_004_repeated_client_initialization(self):
+        """Checks clients built from the shared cached spec are identical"""
+        first = Client(self._service_name)
+        second = Client(self._service_name)
+        self.assertIs(first.spec, second.spec)
+        self.assertEqual(first.operations.keys(), second.operations.keys())
+        for name, operation in first.operations.items():
+            self.assertEqual(operation.get_schema(),
+                             second.operations[name].get_schema())
+
+    def test_005_operation_call(self):
+        """Checks parameters are serialized into the outgoing request"""
+        session = Session(aims_token='token', account_id='2',
+                          global_endpoint='https://example.net')
+        session._session = RecordingSession()
+        client = session.client(self._service_name)
+
+        client.test_get_data(query_param1='q', header_param1='choice2',
+                             query_param2=['a', 'b'], header_param2=5)
+        self.assertEqual(session._session.method, 'get')
+        self.assertEqual(session._session.url,
+                         'https://example.net/testapi/v1/2/test_get_data')
+        self.assertEqual(session._session.kwargs['params'],
+                         {'query_param1': 'q', 'query_param2': ['a', 'b']})
+        self.assertEqual(session._session.kwargs['headers'],
+                         {'header_param1': 'choice2',
+                          'header_param2': '5',
+                          'x-aims-auth-token': 'token'})
+
+        client.post_payload_in_body(payload={'a': 1})
+        self.assertEqual(session._session.method, 'post')
+        self.assertEqual(session._session.kwargs['headers']['content-type'],
+                         'application/json')
+        self.assertEqual(json.loads(session._session.kwargs['data']),
+                         {'a': 1})
+
+    def test_006_internal_params(self):
+        """Checks prefixed arguments are passed on to the session"""
+        session = Session(aims_token='token', account_id='2',
+                          global_endpoint='https://example.net')
+        session._session = RecordingSession()
+        client = session.client(self._service_name)
+
+        client.test_get_data(query_param1='q', header_param1='choice2',
+                             _headers={'x-extra': '1'},
+                             _allow_redirects=False)
+        kwargs = session._session.kwargs
+        self.assertIs(kwargs['allow_redirects'], False)
+        self.assertEqual(kwargs['headers']['x-extra'], '1')
+        self.assertEqual(kwargs['headers']['header_param1'], 'choice2')
+        self.assertNotIn('_headers', kwargs)
+        self.assertNotIn('_allow_redirects', kwargs)
+
+    def test_007_materialize_refs(self):
+        """Checks left over local references are replaced by their targets"""
+        spec = {
+            'paths': {
+                '/test': {
+                    'get': {
+                        'schema': {'$ref': '#/components/schemas/Alias'},
+                        'items': [{'$ref': '#/components/schemas/Model'}]
+                    }
+                }
+            },
+            'components': {
+                'schemas': {
+                    'Alias': {'$ref': '#/components/schemas/Model'},
+                    'Model': {'type': 'string'}
+                }
+            }
+        }
+        model = spec['components']['schemas']['Model']
+        _materialize_refs(spec)
+        operation = spec['paths']['/test']['get']
+        self.assertIs(operation['schema'], model)
+        self.assertIs(operation['items'][0], model)
+        self.assertIs(spec['components']['schemas']['Alias'], model)
+
+    def test_008_spec_file_cache(self):
+        """Checks loaded definitions are cached in the cache directory"""
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        with tempfile.TemporaryDirectory() as tmp_dir, \
+                mock.patch.dict(os.environ, {'ALERTLOGIC_CACHE_DIR':
+                                             os.path.join(tmp_dir, 'cache')}):
+            file_path = os.path.join(tmp_dir, 'testapi.v1.yaml')
+            shutil.copy(
+                os.path.join(dir_path, 'apis', 'testapi', 'testapi.v1.yaml'),
+                file_path)
+
+            spec = _load_spec_file(file_path)
+            cache_path = _get_spec_cache_path(file_path)
+            self.assertTrue(os.path.exists(cache_path))
+            self.assertFalse(os.path.exists(file_path + '.pkl'))
+            cached = _load_spec_file(file_path)
+            self.assertEqual(cached, spec)
+
+            # Keys of cached definitions are interned too
+            for key in cached['paths']:
+                self.assertIs(key, sys.intern(key))
+
+            # Resolved references are still shared
+            schemas = cached['components']['schemas']
+            self.assertIs(
+                schemas['NestedDataTypeModel']['properties']['data'],
+                schemas['SimpleDataTypesModel'])
+
+            # Caches others can modify are never unpickled
+            if hasattr(os, 'getuid'):
+                with open(cache_path, 'wb') as f:
+                    pickle.dump({'x-tampered': True}, f)
+                os.chmod(cache_path, 0o666)
+                self.assertNotIn('x-tampered', _load_spec_file(file_path))
+
+            # Stale cache is ignored once the definitions change
+            with open(file_path, 'a') as f:
+                f.write('x-changed: true\n')
+            self.assertTrue(_load_spec_file(file_path)['x-changed'])
+            self.assertFalse(os.path.exists(cache_path))
+
+    def test_009_path_templates(self):
+        """Checks compiled path templates match str.format_map"""
+        params = {'account_id': '2', 'id': 5}
+        for template in ['/testapi/v1/{account_id}/things/{id}',
+                         '/testapi/v1/things',
+                         '/{{literal}}/{id}',
+                         '/{id!r}/{account_id:>4}']:
+            self.assertEqual(_compile_path_template(template)(params),
+                             template.format_map(params))
+        self.assertRaises(KeyError,
+                          _compile_path_template('/{missing}'), params)
+
+    def test_010_parameter_defaults(self):
+        """Checks session defaults are only used for missing arguments"""
+        class DefaultsSession():
+            calls = 0
+
+            def get_default(self, name):
+                self.calls += 1
+                return 'default' if name == 'account_id' else None
+
+        session = DefaultsSession()
+        param = PathParameter(
+            spec={'name': 'account_id', 'in': 'path', 'required': True,
+                  'schema': {'type': 'string'}},
+            session=session)
+
+        target = {}
+        param.serialize(target, {'account_id': '2'})
+        self.assertEqual(target, {'account_id': '2'})
+        self.assertEqual(session.calls, 0)
+
+        for _ in range(2):
+            param.serialize(target, {})
+            self.assertEqual(target, {'account_id': 'default'})
+        self.assertEqual(session.calls, 1)
+
+    def test_011_service_spec_reload(self):
+        """Checks loaded definitions are reloaded once the file changes"""
+        dir_path = os.path.dirname(os.path.realpath(__file__))
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            api_dir = os.path.join(tmp_dir, 'apis')
+            shutil.copytree(os.path.join(dir_path, 'apis'), api_dir)
+
+            spec = _load_service_spec(self._service_name, api_dir)
+            self.assertIs(_load_service_spec(self._service_name, api_dir),
+                          spec)
+            self.assertNotIn('x-changed', spec)
+
+            file_path = os.path.join(api_dir, 'testapi', 'testapi.v1.yaml')
+            with open(file_path, 'a') as f:
+                f.write('x-changed: true\n')
+            self.assertTrue(
+                _load_service_spec(self._service_name, api_dir)['x-changed'])
+
+            # New versions are picked up as the latest
+            with open(file_path) as f:
+                definitions = f.read()
+            with open(file_path.replace('.v1.', '.v2.'), 'w') as f:
+                f.write(definitions + 'x-version: 2\n')
+            self.assertEqual(
+                _load_service_spec(self._service_name, api_dir)['x-version'],
+                2)
+
+    def test_012_validation_error(self):
+        """Checks validation errors carry the schema that failed"""
+        session = Session(aims_token='token', account_id='2',
+                          global_endpoint='https://example.net')
+        session._session = RecordingSession()
+        client = session.client(self._service_name)
+
+        with self.assertRaises(AlmdrlibValueError) as cm:
+            client.post_payload_in_body(payload='x')
+        self.assertIn("'x' is not of type 'object'", str(cm.exception))
+        self.assertEqual(cm.exception.schema['type'], 'object')
+
+    def test_013_validator_cache(self):
+        """Checks constructing a client again reuses its validators"""
+        Client(self._service_name)
+        cached_validators = len(_validators_by_id)
+        Client(self._service_name)
+        self.assertEqual(len(_validators_by_id), cached_validators)
+
+    def test_014_schema_copies(self):
+        """Checks callers can modify the schemas they get"""
+        client = Client(self._service_name)
+        for operation in client.operations.values():
+            operation.get_schema().pop(OpenAPIKeyWord.DESCRIPTION)
+            self.assertIn(OpenAPIKeyWord.DESCRIPTION, operation.get_schema())
+            body_schema = operation.body and operation.body.get_schema()
+            if body_schema:
+                body_schema.pop(OpenAPIKeyWord.PROPERTIES)
+                self.assertIn(OpenAPIKeyWord.PROPERTIES,
+                              operation.body.get_schema())